@@ -115,6 +115,16 @@ export async function getStockData(symbol) {
   return result ? result.data : []
 }
 
+// Batched variant of getStockData: issues all reads inside a single readonly
+// transaction instead of opening one transaction per symbol
+export async function getStockDataBatch(symbols) {
+  const db = await getDB()
+  const tx = db.transaction(STOCKS_STORE, "readonly")
+  const store = tx.objectStore(STOCKS_STORE)
+  const results = await Promise.all(symbols.map((symbol) => store.get(symbol)))
+  return results.map((result) => (result ? result.data : []))
+}
+
 // New watchlist functions
 export async function createWatchlist(name) {
   const id = Date.now().toString() // Simple unique ID
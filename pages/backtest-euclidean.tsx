@@ -255,20 +255,17 @@ export default function BacktestEuclidean() {
 
       // Filter and sort data by date
       const pricesA = filterByDate(stockAData.data).sort(
-        (a, b) => new Date(a.date).getTime() - new Date(b.date).getTime(),
+        (a, b) => (a.date < b.date ? -1 : a.date > b.date ? 1 : 0),
       )
       const pricesB = filterByDate(stockBData.data).sort(
-        (a, b) => new Date(a.date).getTime() - new Date(b.date).getTime(),
+        (a, b) => (a.date < b.date ? -1 : a.date > b.date ? 1 : 0),
       )
 
-      // Ensure both arrays have the same dates
-      const commonDates = pricesA
-        .filter((a) => pricesB.some((b) => b.date === a.date))
-        .map((a) => a.date)
-        .sort()
-
-      const alignedPricesA = commonDates.map((date) => pricesA.find((p) => p.date === date)).filter(Boolean)
-      const alignedPricesB = commonDates.map((date) => pricesB.find((p) => p.date === date)).filter(Boolean)
+      // Ensure both arrays have the same dates; a Map keyed by date makes the
+      // alignment a single pass over each series instead of a nested scan
+      const pricesBByDate = new Map(pricesB.map((p) => [p.date, p]))
+      const alignedPricesA = pricesA.filter((p) => pricesBByDate.has(p.date))
+      const alignedPricesB = alignedPricesA.map((p) => pricesBByDate.get(p.date))
 
       const minLength = Math.min(alignedPricesA.length, alignedPricesB.length)
 
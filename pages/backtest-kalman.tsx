@@ -32,14 +32,15 @@ const scalarInverse = (x: number): number => {
   return Math.abs(x) < 1e-10 ? 1.0 : 1.0 / x
 }
 
-// Kalman filter implementation (copied from pair-analyzer.tsx)
+// Kalman filter implementation (copied from pair-analyzer.tsx). Takes flat
+// numeric close arrays; the caller extracts and coerces the columns once.
 const kalmanFilter = (
-  pricesA: { close: number; date: string }[],
-  pricesB: { close: number; date: string }[],
+  closesA: Float64Array | number[],
+  closesB: Float64Array | number[],
   processNoise = 0.0001,
   initialLookback = 60,
 ) => {
-  const n = pricesA.length
+  const n = closesA.length
 
   if (n < initialLookback) {
     console.warn(`Not enough data for Kalman filter initialization. Need ${initialLookback}, got ${n}`)
@@ -52,8 +53,8 @@ const kalmanFilter = (
     sumAB = 0,
     sumB2 = 0
   for (let i = 0; i < initialLookback; i++) {
-    const priceA = typeof pricesA[i].close === "string" ? Number.parseFloat(pricesA[i].close) : pricesA[i].close
-    const priceB = typeof pricesB[i].close === "string" ? Number.parseFloat(pricesB[i].close) : pricesB[i].close
+    const priceA = closesA[i]
+    const priceB = closesB[i]
 
     sumA += priceA
     sumB += priceB
@@ -73,10 +74,8 @@ const kalmanFilter = (
   // Calculate initial measurement noise from OLS residuals
   let residualSumSquares = 0
   for (let i = 0; i < initialLookback; i++) {
-    const priceA = typeof pricesA[i].close === "string" ? Number.parseFloat(pricesA[i].close) : pricesA[i].close
-    const priceB = typeof pricesB[i].close === "string" ? Number.parseFloat(pricesB[i].close) : pricesB[i].close
-    const predicted = initialAlpha + initialBeta * priceB
-    const residual = priceA - predicted
+    const predicted = initialAlpha + initialBeta * closesB[i]
+    const residual = closesA[i] - predicted
     residualSumSquares += residual * residual
   }
   const adaptiveR = residualSumSquares / (initialLookback - 2) // Use adaptive measurement noise
@@ -104,15 +103,13 @@ const kalmanFilter = (
   for (let i = 0; i < initialLookback; i++) {
     hedgeRatios.push(initialBeta)
     alphas.push(initialAlpha)
-    const priceA = typeof pricesA[i].close === "string" ? Number.parseFloat(pricesA[i].close) : pricesA[i].close
-    const priceB = typeof pricesB[i].close === "string" ? Number.parseFloat(pricesB[i].close) : pricesB[i].close
-    spreads.push(priceA - (initialAlpha + initialBeta * priceB))
+    spreads.push(closesA[i] - (initialAlpha + initialBeta * closesB[i]))
   }
 
   // Process remaining data points with Kalman filter
   for (let i = initialLookback; i < n; i++) {
-    const priceA = typeof pricesA[i].close === "string" ? Number.parseFloat(pricesA[i].close) : pricesA[i].close
-    const priceB = typeof pricesB[i].close === "string" ? Number.parseFloat(pricesB[i].close) : pricesB[i].close
+    const priceA = closesA[i]
+    const priceB = closesB[i]
 
     // Prediction step
     // x_pred = F @ x (F is identity, so x_pred = x)
@@ -420,23 +417,31 @@ export default function BacktestKalman() {
 
       // Filter and sort data by date
       const pricesA = filterByDate(stockAData.data).sort(
-        (a, b) => new Date(a.date).getTime() - new Date(b.date).getTime(),
+        (a, b) => (a.date < b.date ? -1 : a.date > b.date ? 1 : 0),
       )
       const pricesB = filterByDate(stockBData.data).sort(
-        (a, b) => new Date(a.date).getTime() - new Date(b.date).getTime(),
+        (a, b) => (a.date < b.date ? -1 : a.date > b.date ? 1 : 0),
       )
 
-      // Ensure both arrays have the same dates
-      const commonDates = pricesA
-        .filter((a) => pricesB.some((b) => b.date === a.date))
-        .map((a) => a.date)
-        .sort()
-
-      const alignedPricesA = commonDates.map((date) => pricesA.find((p) => p.date === date)).filter(Boolean)
-      const alignedPricesB = commonDates.map((date) => pricesB.find((p) => p.date === date)).filter(Boolean)
+      // Ensure both arrays have the same dates; a Map keyed by date makes the
+      // alignment a single pass over each series instead of a nested scan
+      const pricesBByDate = new Map(pricesB.map((p) => [p.date, p]))
+      const alignedPricesA = pricesA.filter((p) => pricesBByDate.has(p.date))
+      const alignedPricesB = alignedPricesA.map((p) => pricesBByDate.get(p.date))
 
       const minLength = Math.min(alignedPricesA.length, alignedPricesB.length)
 
+      // Extract the close columns once as flat numeric arrays so the Kalman
+      // loop reads contiguous numbers instead of re-coercing object fields
+      const closesA = new Float64Array(minLength)
+      const closesB = new Float64Array(minLength)
+      for (let i = 0; i < minLength; i++) {
+        const priceA = alignedPricesA[i].close
+        const priceB = alignedPricesB[i].close
+        closesA[i] = typeof priceA === "string" ? Number.parseFloat(priceA) : priceA
+        closesB[i] = typeof priceB === "string" ? Number.parseFloat(priceB) : priceB
+      }
+
       if (minLength < kalmanInitialLookback) {
         alert(
           `Insufficient data for Kalman initialization. Need at least ${kalmanInitialLookback} days, but only have ${minLength} days.`,
@@ -450,7 +455,7 @@ export default function BacktestKalman() {
         hedgeRatios,
         alphas,
         spreads: kalmanSpreads,
-      } = kalmanFilter(alignedPricesA, alignedPricesB, kalmanProcessNoise, kalmanInitialLookback)
+      } = kalmanFilter(closesA, closesB, kalmanProcessNoise, kalmanInitialLookback)
 
       // Calculate Z-scores for Kalman spreads
       const zScores = []
@@ -461,8 +466,8 @@ export default function BacktestKalman() {
 
       const tableData = kalmanSpreads.map((spread, index) => ({
         date: alignedPricesA[index].date,
-        stockAClose: alignedPricesA[index].close,
-        stockBClose: alignedPricesB[index].close,
+        stockAClose: closesA[index],
+        stockBClose: closesB[index],
         alpha: alphas[index],
         hedgeRatio: hedgeRatios[index],
         spread: spread,
@@ -41,9 +41,11 @@ const Backtest = () => {
     return data.filter((entry) => entry.date >= fromDate && entry.date <= toDate)
   }
 
-  const calculateHedgeRatio = (pricesA, pricesB, currentIndex, windowSize) => {
-    const startIdx = Math.max(0, currentIndex - windowSize + 1)
-    const endIdx = currentIndex + 1
+  // Rolling hedge ratios for every bar in one O(n) pass: the window sums are
+  // updated incrementally (add the incoming bar, drop the outgoing one)
+  // instead of being re-accumulated from scratch for each bar
+  const calculateRollingHedgeRatios = (pricesA, pricesB, length, windowSize) => {
+    const hedgeRatios = new Array(length)
 
     let sumA = 0,
       sumB = 0,
@@ -51,18 +53,31 @@ const Backtest = () => {
       sumB2 = 0
     let count = 0
 
-    for (let i = startIdx; i < endIdx; i++) {
-      sumA += pricesA[i].close
-      sumB += pricesB[i].close
-      sumAB += pricesA[i].close * pricesB[i].close
-      sumB2 += pricesB[i].close * pricesB[i].close
+    for (let i = 0; i < length; i++) {
+      const priceA = pricesA[i].close
+      const priceB = pricesB[i].close
+      sumA += priceA
+      sumB += priceB
+      sumAB += priceA * priceB
+      sumB2 += priceB * priceB
       count++
-    }
 
-    // Avoid division by zero
-    if (count === 0 || count * sumB2 - sumB * sumB === 0) return 1
+      if (i >= windowSize) {
+        const oldA = pricesA[i - windowSize].close
+        const oldB = pricesB[i - windowSize].close
+        sumA -= oldA
+        sumB -= oldB
+        sumAB -= oldA * oldB
+        sumB2 -= oldB * oldB
+        count--
+      }
+
+      // Avoid division by zero
+      const denominator = count * sumB2 - sumB * sumB
+      hedgeRatios[i] = count === 0 || denominator === 0 ? 1 : (count * sumAB - sumA * sumB) / denominator
+    }
 
-    return (count * sumAB - sumA * sumB) / (count * sumB2 - sumB * sumB)
+    return hedgeRatios
   }
 
   const runBacktest = async () => {
@@ -90,13 +105,12 @@ const Backtest = () => {
       const minLength = Math.min(pricesA.length, pricesB.length)
 
       const spreads = []
-      const hedgeRatios = []
 
       // Calculate rolling hedge ratios and spreads
+      // Use same lookback period for both hedge ratio and z-score for consistency
+      const hedgeRatios = calculateRollingHedgeRatios(pricesA, pricesB, minLength, lookbackPeriod)
       for (let i = 0; i < minLength; i++) {
-        // Use same lookback period for both hedge ratio and z-score for consistency
-        const currentHedgeRatio = calculateHedgeRatio(pricesA, pricesB, i, lookbackPeriod)
-        hedgeRatios.push(currentHedgeRatio)
+        const currentHedgeRatio = hedgeRatios[i]
 
         spreads.push({
           date: pricesA[i].date,
@@ -8,18 +8,28 @@ const calculateZScoreLocal = (data, lookback) => {
     return Array(data.length).fill(0) // Not enough data for initial z-score
   }
 
-  const zScores = []
+  // Rolling sum and sum-of-squares make each bar O(1) instead of re-scanning
+  // the whole lookback window per bar
+  const zScores = new Array(data.length)
+  let sum = 0
+  let sumSq = 0
   for (let i = 0; i < data.length; i++) {
-    const windowStart = Math.max(0, i - lookback + 1)
-    const windowData = data.slice(windowStart, i + 1)
-
-    if (windowData.length === lookback) {
-      const mean = windowData.reduce((sum, val) => sum + val, 0) / windowData.length
-      const variance = windowData.reduce((sum, val) => sum + Math.pow(val - mean, 2), 0) / (windowData.length - 1) // Sample variance
-      const stdDev = Math.sqrt(variance)
-      zScores.push(stdDev > 0 ? (data[i] - mean) / stdDev : 0)
+    const value = data[i]
+    sum += value
+    sumSq += value * value
+
+    if (i >= lookback) {
+      const old = data[i - lookback]
+      sum -= old
+      sumSq -= old * old
+    }
+
+    if (i + 1 >= lookback) {
+      const mean = sum / lookback
+      const variance = (sumSq - sum * mean) / (lookback - 1) // Sample variance
+      zScores[i] = variance > 0 ? (value - mean) / Math.sqrt(variance) : 0
     } else {
-      zScores.push(0) // Not enough data in window yet
+      zScores[i] = 0 // Not enough data in window yet
     }
   }
   return zScores
@@ -103,37 +113,52 @@ export default function BacktestSpread() {
     return data.filter((entry) => entry.date >= fromDate && entry.date <= toDate)
   }
 
-  const calculateHedgeRatio = (pricesA, pricesB, currentIndex, windowSize) => {
-    const startIdx = Math.max(0, currentIndex - windowSize + 1)
-    const endIdx = currentIndex + 1
+  const calculateRollingHedgeRatios = (pricesA, pricesB, windowSize) => {
+    const n = Math.min(pricesA.length, pricesB.length)
+    const hedgeRatios = new Array(n)
+    const alphas = new Array(n)
 
+    // Maintain rolling sums over the window: add the incoming point, drop the
+    // outgoing one. This gives every window's OLS fit in a single O(n) pass
+    // instead of re-summing the whole window for each bar.
     let sumA = 0,
       sumB = 0,
       sumAB = 0,
       sumB2 = 0
-    let count = 0
 
-    for (let i = startIdx; i < endIdx; i++) {
+    for (let i = 0; i < n; i++) {
       const priceA = pricesA[i].close
       const priceB = pricesB[i].close
       sumA += priceA
       sumB += priceB
       sumAB += priceA * priceB
       sumB2 += priceB * priceB
-      count++
-    }
 
-    // Avoid division by zero
-    if (count === 0 || count * sumB2 - sumB * sumB === 0) {
-      return { beta: 1, alpha: 0 } // Return default alpha and beta
-    }
+      if (i >= windowSize) {
+        const oldA = pricesA[i - windowSize].close
+        const oldB = pricesB[i - windowSize].close
+        sumA -= oldA
+        sumB -= oldB
+        sumAB -= oldA * oldB
+        sumB2 -= oldB * oldB
+      }
+
+      const count = Math.min(i + 1, windowSize)
+      const denominator = count * sumB2 - sumB * sumB
 
-    const numerator = count * sumAB - sumA * sumB
-    const denominator = count * sumB2 - sumB * sumB
-    const beta = numerator / denominator
-    const alpha = sumA / count - beta * (sumB / count)
+      // Avoid division by zero
+      if (count === 0 || denominator === 0) {
+        hedgeRatios[i] = 1
+        alphas[i] = 0
+        continue
+      }
+
+      const beta = (count * sumAB - sumA * sumB) / denominator
+      hedgeRatios[i] = beta
+      alphas[i] = sumA / count - beta * (sumB / count)
+    }
 
-    return { beta, alpha } // Return both beta and alpha
+    return { hedgeRatios, alphas }
   }
 
   const calculateAdvancedMetrics = (trades, method = "hedged") => {
@@ -492,20 +517,18 @@ export default function BacktestSpread() {
 
       // Filter and sort data by date
       const pricesA = filterByDate(stockAData.data).sort(
-        (a, b) => new Date(a.date).getTime() - new Date(b.date).getTime(),
+        (a, b) => (a.date < b.date ? -1 : a.date > b.date ? 1 : 0),
       )
       const pricesB = filterByDate(stockBData.data).sort(
-        (a, b) => new Date(a.date).getTime() - new Date(b.date).getTime(),
+        (a, b) => (a.date < b.date ? -1 : a.date > b.date ? 1 : 0),
       )
 
-      // Ensure both arrays have the same dates
-      const commonDates = pricesA
-        .filter((a) => pricesB.some((b) => b.date === a.date))
-        .map((a) => a.date)
-        .sort()
+      // Ensure both arrays have the same dates; index B by date once instead
+      // of rescanning it for every date in A
+      const pricesBByDate = new Map(pricesB.map((p) => [p.date, p]))
 
-      const alignedPricesA = commonDates.map((date) => pricesA.find((p) => p.date === date)).filter(Boolean)
-      const alignedPricesB = commonDates.map((date) => pricesB.find((p) => p.date === date)).filter(Boolean)
+      const alignedPricesA = pricesA.filter((p) => pricesBByDate.has(p.date))
+      const alignedPricesB = alignedPricesA.map((p) => pricesBByDate.get(p.date))
 
       const minLength = Math.min(alignedPricesA.length, alignedPricesB.length)
 
@@ -521,21 +544,16 @@ export default function BacktestSpread() {
         return
       }
 
-      const spreads = []
-      const hedgeRatios = []
-      const alphas = [] // New array to store alphas
+      // Calculate rolling hedge ratios (beta) and alpha in one pass, then the spreads
+      // Use olsLookbackWindow for hedge ratio calculation
+      const { hedgeRatios, alphas } = calculateRollingHedgeRatios(alignedPricesA, alignedPricesB, olsLookbackWindow)
 
-      // Calculate rolling hedge ratios (beta) and alpha, and spreads
+      const spreads = []
       for (let i = 0; i < minLength; i++) {
-        // Use olsLookbackWindow for hedge ratio calculation
-        const { beta, alpha } = calculateHedgeRatio(alignedPricesA, alignedPricesB, i, olsLookbackWindow)
-        hedgeRatios.push(beta)
-        alphas.push(alpha) // Store alpha
-
         const currentPriceA = alignedPricesA[i].close
         const currentPriceB = alignedPricesB[i].close
         // Calculate spread using the current alpha and beta
-        const spread = currentPriceA - (alpha + beta * currentPriceB)
+        const spread = currentPriceA - (alphas[i] + hedgeRatios[i] * currentPriceB)
         spreads.push(spread)
       }
 
@@ -95,10 +95,10 @@ export default function Backtest() {
 
       // Sort data by date ascending for proper chronological order
       const pricesA = filterByDate(stockAData.data).sort(
-        (a, b) => new Date(a.date).getTime() - new Date(b.date).getTime(),
+        (a, b) => (a.date < b.date ? -1 : a.date > b.date ? 1 : 0),
       )
       const pricesB = filterByDate(stockBData.data).sort(
-        (a, b) => new Date(a.date).getTime() - new Date(b.date).getTime(),
+        (a, b) => (a.date < b.date ? -1 : a.date > b.date ? 1 : 0),
       )
 
       // Ensure both arrays have the same dates
@@ -1,6 +1,6 @@
 "use client"
 
-import { useState, useEffect } from "react"
+import { useState, useEffect, useRef } from "react"
 import { openDB } from "idb"
 import {
   LineChart,
@@ -153,9 +153,14 @@ export default function PairAnalyzer() {
   const filterByDate = (data, from, to) => {
     return data
       .filter((entry) => entry.date >= from && entry.date <= to)
-      .sort((a, b) => new Date(a.date).getTime() - new Date(b.date).getTime()) // Sort by date in ascending order
+      .sort((a, b) => (a.date < b.date ? -1 : a.date > b.date ? 1 : 0)) // Sort by date in ascending order
   }
 
+  // Memoizes the last completed run so re-clicking Analyze with the same
+  // pair, date range and parameters skips the IndexedDB read and the worker
+  // round-trip entirely
+  const lastAnalysisRef = useRef({ key: null, result: null })
+
   const runAnalysis = async () => {
     if (!selectedPair.stockA || !selectedPair.stockB) {
       setError("Please select both stocks for analysis.")
@@ -167,6 +172,29 @@ export default function PairAnalyzer() {
       return
     }
 
+    const analysisKey = JSON.stringify({
+      stockA: selectedPair.stockA,
+      stockB: selectedPair.stockB,
+      fromDate,
+      toDate,
+      modelType: activeTab,
+      ratioLookbackWindow,
+      olsLookbackWindow,
+      kalmanProcessNoise,
+      kalmanMeasurementNoise,
+      kalmanInitialLookback,
+      euclideanLookbackWindow,
+      zScoreLookback,
+      entryThreshold,
+      exitThreshold,
+    })
+
+    if (lastAnalysisRef.current.key === analysisKey && lastAnalysisRef.current.result) {
+      setError("")
+      setAnalysisData(lastAnalysisRef.current.result)
+      return
+    }
+
     setIsLoading(true)
     setError("")
     setAnalysisData(null) // Clear previous results
@@ -244,6 +272,7 @@ export default function PairAnalyzer() {
       })
 
       const result = await analysisPromise
+      lastAnalysisRef.current = { key: analysisKey, result }
       setIsLoading(false)
       setAnalysisData(result)
     } catch (error) {
@@ -1323,7 +1352,7 @@ export default function PairAnalyzer() {
                         />
                         <Scatter
                           name="Stock Prices"
-                          data={analysisData.stockAPrices.map((priceA, i) => ({
+                          data={Array.from(analysisData.stockAPrices, (priceA, i) => ({
                             stockA: priceA,
                             stockB: analysisData.stockBPrices[i],
                             date: analysisData.dates[i],
@@ -4,9 +4,21 @@ import { useState, useEffect } from "react"
 import Link from "next/link"
 import { useRouter } from "next/router"
 import { getAllWatchlists } from "../lib/indexedDB"
-import { getStockData } from "../lib/indexedDB"
+import { getStockDataBatch } from "../lib/indexedDB"
 import { AlertCircle, ExternalLink, Loader2 } from "lucide-react"
 
+// Singleton scanner worker, mirroring the shared calculations worker in
+// _app.tsx: the per-pair metric math runs off the main thread so big scans
+// don't freeze the page
+let scannerWorker: Worker | null = null
+
+function getScannerWorker(): Worker {
+  if (!scannerWorker) {
+    scannerWorker = new Worker("/workers/scanner-worker.js", { type: "module" })
+  }
+  return scannerWorker
+}
+
 export default function Scanner() {
   const router = useRouter()
   const [watchlists, setWatchlists] = useState([])
@@ -93,72 +105,68 @@ export default function Scanner() {
         return
       }
 
-      // Process each pair
-      const results = []
-
-      for (let i = 0; i < pairsToScan.length; i++) {
-        const pair = pairsToScan[i]
-
-        // Update progress
-        setProcessedPairs(i + 1)
-        setProgress(Math.round(((i + 1) / pairsToScan.length) * 100))
-
-        try {
-          // Fetch stock data
-          const stockAData = await getStockData(pair.stockA)
-          const stockBData = await getStockData(pair.stockB)
-
-          if (!stockAData || !stockBData || stockAData.length === 0 || stockBData.length === 0) {
-            console.warn(`Missing data for pair ${pair.stockA}/${pair.stockB}`)
-            continue
-          }
-
-          // Ensure data is sorted by date (ascending)
-          const sortedStockAData = [...stockAData].sort((a, b) => new Date(a.date) - new Date(b.date))
-          const sortedStockBData = [...stockBData].sort((a, b) => new Date(a.date) - new Date(b.date))
+      // Fetch and prepare every referenced symbol once, up front, instead of
+      // re-fetching and re-sorting it for each pair that mentions it
+      const symbols = [...new Set(pairsToScan.flatMap((pair) => [pair.stockA, pair.stockB]))]
+      const stockDataBySymbol = await getStockDataBatch(symbols)
+
+      const preparedData = new Map()
+      symbols.forEach((symbol, idx) => {
+        const data = stockDataBySymbol[idx]
+        if (!data || data.length === 0) return
+
+        // Ensure data is sorted by date (ascending), then keep only the most
+        // recent lookback period
+        const sorted = [...data].sort((a, b) => (a.date < b.date ? -1 : a.date > b.date ? 1 : 0))
+        preparedData.set(symbol, sorted.slice(-lookbackPeriod))
+      })
+
+      // Build the worker payload: flat close arrays plus the display fields,
+      // one entry per pair with enough data
+      const pairPayloads = []
+      for (const pair of pairsToScan) {
+        const recentStockAData = preparedData.get(pair.stockA)
+        const recentStockBData = preparedData.get(pair.stockB)
+
+        if (!recentStockAData || !recentStockBData) {
+          console.warn(`Missing data for pair ${pair.stockA}/${pair.stockB}`)
+          continue
+        }
 
-          // Get the most recent lookback period data
-          const recentStockAData = sortedStockAData.slice(-lookbackPeriod)
-          const recentStockBData = sortedStockBData.slice(-lookbackPeriod)
+        // Ensure we have enough data points
+        if (recentStockAData.length < lookbackPeriod || recentStockBData.length < lookbackPeriod) {
+          console.warn(`Insufficient data for pair ${pair.stockA}/${pair.stockB}`)
+          continue
+        }
 
-          // Ensure we have enough data points
-          if (recentStockAData.length < lookbackPeriod || recentStockBData.length < lookbackPeriod) {
-            console.warn(`Insufficient data for pair ${pair.stockA}/${pair.stockB}`)
-            continue
-          }
+        pairPayloads.push({
+          stockA: pair.stockA,
+          stockB: pair.stockB,
+          watchlistName: pair.watchlistName,
+          watchlistId: pair.watchlistId,
+          pricesA: Float64Array.from(recentStockAData, (d) => d.close),
+          pricesB: Float64Array.from(recentStockBData, (d) => d.close),
+          lastPriceA: recentStockAData[recentStockAData.length - 1].close,
+          lastPriceB: recentStockBData[recentStockBData.length - 1].close,
+          lastDate: recentStockAData[recentStockAData.length - 1].date,
+        })
+      }
 
-          // Calculate spread based on selected method
-          const { zScore, correlation, halfLife, signal } = calculatePairMetrics(
-            recentStockAData,
-            recentStockBData,
-            method,
-          )
-
-          // Check if z-score is within the specified range (absolute value)
-          const absZScore = Math.abs(zScore)
-          if (absZScore >= minZScore && absZScore <= maxZScore) {
-            results.push({
-              stockA: pair.stockA,
-              stockB: pair.stockB,
-              watchlistName: pair.watchlistName,
-              watchlistId: pair.watchlistId,
-              zScore,
-              correlation,
-              halfLife,
-              signal,
-              method,
-              lastPriceA: recentStockAData[recentStockAData.length - 1].close,
-              lastPriceB: recentStockBData[recentStockBData.length - 1].close,
-              lastDate: recentStockAData[recentStockAData.length - 1].date,
-            })
+      // Screen every pair in one round trip to the scanner worker; progress
+      // messages keep the bar live while the main thread stays free
+      const results = await new Promise((resolve, reject) => {
+        const worker = getScannerWorker()
+        worker.onmessage = (event) => {
+          if (event.data.type === "progress") {
+            setProcessedPairs(event.data.processed)
+            setProgress(Math.round((event.data.processed / event.data.total) * 100))
+          } else if (event.data.type === "scanComplete") {
+            resolve(event.data.results)
           }
-        } catch (err) {
-          console.error(`Error processing pair ${pair.stockA}/${pair.stockB}:`, err)
         }
-      }
-
-      // Sort results by absolute z-score (descending)
-      results.sort((a, b) => Math.abs(b.zScore) - Math.abs(a.zScore))
+        worker.onerror = (e) => reject(e)
+        worker.postMessage({ type: "scanPairs", pairs: pairPayloads, method, minZScore, maxZScore })
+      })
 
       setScanResults(results)
     } catch (err) {
@@ -169,139 +177,6 @@ export default function Scanner() {
     }
   }
 
-  // Calculate pair metrics based on selected method
-  const calculatePairMetrics = (stockAData, stockBData, method) => {
-    // Extract closing prices
-    const pricesA = stockAData.map((d) => d.close)
-    const pricesB = stockBData.map((d) => d.close)
-
-    // Calculate correlation
-    const correlation = calculateCorrelation(pricesA, pricesB)
-
-    let spread = []
-    let zScore = 0
-    let halfLife = null
-
-    // Calculate spread based on method
-    if (method === "ratio") {
-      // Ratio method
-      spread = pricesA.map((price, i) => price / pricesB[i])
-    } else if (method === "ols") {
-      // OLS regression method
-      const { slope, intercept } = calculateOLS(pricesA, pricesB)
-      spread = pricesA.map((price, i) => price - (slope * pricesB[i] + intercept))
-    } else if (method === "kalman") {
-      // Kalman filter method (simplified implementation)
-      const { slope, intercept } = calculateKalmanFilter(pricesA, pricesB)
-      spread = pricesA.map((price, i) => price - (slope * pricesB[i] + intercept))
-    }
-
-    // Calculate z-score of the spread
-    const mean = spread.reduce((sum, val) => sum + val, 0) / spread.length
-    const stdDev = Math.sqrt(spread.reduce((sum, val) => sum + Math.pow(val - mean, 2), 0) / spread.length)
-
-    zScore = (spread[spread.length - 1] - mean) / stdDev
-
-    // Calculate half-life
-    try {
-      halfLife = calculateHalfLife(spread)
-    } catch (err) {
-      console.warn("Half-life calculation failed:", err)
-      halfLife = null
-    }
-
-    // Determine signal
-    let signal = "None"
-    const stockASymbol = stockAData[0].symbol || stockAData[0].stockA
-    const stockBSymbol = stockBData[0].symbol || stockBData[0].stockB
-    if (zScore > 0) {
-      signal = `Short ${stockASymbol} / Long ${stockBSymbol}`
-    } else if (zScore < 0) {
-      signal = `Long ${stockASymbol} / Short ${stockBSymbol}`
-    }
-
-    return { zScore, correlation, halfLife, signal }
-  }
-
-  // Calculate correlation between two arrays
-  const calculateCorrelation = (x, y) => {
-    const n = x.length
-    let sumX = 0
-    let sumY = 0
-    let sumXY = 0
-    let sumX2 = 0
-    let sumY2 = 0
-
-    for (let i = 0; i < n; i++) {
-      sumX += x[i]
-      sumY += y[i]
-      sumXY += x[i] * y[i]
-      sumX2 += x[i] * x[i]
-      sumY2 += y[i] * y[i]
-    }
-
-    const numerator = n * sumXY - sumX * sumY
-    const denominator = Math.sqrt((n * sumX2 - sumX * sumX) * (n * sumY2 - sumY * sumY))
-
-    return denominator === 0 ? 0 : numerator / denominator
-  }
-
-  // Calculate OLS regression
-  const calculateOLS = (y, x) => {
-    const n = x.length
-    let sumX = 0
-    let sumY = 0
-    let sumXY = 0
-    let sumX2 = 0
-
-    for (let i = 0; i < n; i++) {
-      sumX += x[i]
-      sumY += y[i]
-      sumXY += x[i] * y[i]
-      sumX2 += x[i] * x[i]
-    }
-
-    const slope = (n * sumXY - sumX * sumY) / (n * sumX2 - sumX * sumX)
-    const intercept = (sumY - slope * sumX) / n
-
-    return { slope, intercept }
-  }
-
-  // Calculate Kalman filter (simplified implementation)
-  const calculateKalmanFilter = (y, x) => {
-    // For simplicity, we'll use OLS as an approximation
-    // In a real implementation, this would be a proper Kalman filter
-    return calculateOLS(y, x)
-  }
-
-  // Calculate half-life of mean reversion
-  const calculateHalfLife = (spread) => {
-    const laggedSpread = spread.slice(0, -1)
-    const deltaSpread = spread.slice(1).map((val, i) => val - laggedSpread[i])
-
-    // Perform linear regression: deltaSpread = beta * laggedSpread + error
-    let sumX = 0
-    let sumY = 0
-    let sumXY = 0
-    let sumX2 = 0
-
-    for (let i = 0; i < laggedSpread.length; i++) {
-      sumX += laggedSpread[i]
-      sumY += deltaSpread[i]
-      sumXY += laggedSpread[i] * deltaSpread[i]
-      sumX2 += laggedSpread[i] * laggedSpread[i]
-    }
-
-    const beta = (laggedSpread.length * sumXY - sumX * sumY) / (laggedSpread.length * sumX2 - sumX * sumX)
-
-    // Calculate half-life: -log(2) / log(1 + beta)
-    if (beta >= 0) {
-      return null // No mean reversion
-    }
-
-    return Math.round(-Math.log(2) / Math.log(1 + beta))
-  }
-
   // Format z-score for display
   const formatZScore = (zScore) => {
     return zScore.toFixed(2)
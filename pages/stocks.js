@@ -65,6 +65,15 @@ export default function Stocks() {
         throw new Error(`CSV is missing required headers: ${missingHeaders.join(", ")}`)
       }
 
+      // Resolve column positions once so each row reads straight by index —
+      // no per-row header dictionary
+      const symbolIdx = headers.indexOf("symbol")
+      const dateIdx = headers.indexOf("date")
+      const openIdx = headers.indexOf("open")
+      const highIdx = headers.indexOf("high")
+      const lowIdx = headers.indexOf("low")
+      const closeIdx = headers.indexOf("close")
+
       // Process data rows
       const stockData = []
       const processedSymbols = new Set()
@@ -73,15 +82,10 @@ export default function Stocks() {
       for (let i = 1; i < rows.length; i++) {
         if (!rows[i].trim()) continue
 
-        const values = rows[i].split(",").map((val) => val.trim())
+        const values = rows[i].split(",")
         if (values.length !== headers.length) continue
 
-        const rowData = {}
-        headers.forEach((header, index) => {
-          rowData[header] = values[index]
-        })
-
-        const symbol = rowData.symbol
+        const symbol = values[symbolIdx].trim()
         processedSymbols.add(symbol)
 
         if (!symbolData[symbol]) {
@@ -89,12 +93,12 @@ export default function Stocks() {
         }
 
         const dataPoint = {
-          date: rowData.date,
+          date: values[dateIdx].trim(),
           symbol: symbol,
-          open: Number.parseFloat(rowData.open) || 0,
-          high: Number.parseFloat(rowData.high) || 0,
-          low: Number.parseFloat(rowData.low) || 0,
-          close: Number.parseFloat(rowData.close) || 0,
+          open: Number.parseFloat(values[openIdx]) || 0,
+          high: Number.parseFloat(values[highIdx]) || 0,
+          low: Number.parseFloat(values[lowIdx]) || 0,
+          close: Number.parseFloat(values[closeIdx]) || 0,
         }
 
         symbolData[symbol].push(dataPoint)
@@ -1,230 +1,84 @@
 // public/workers/calculations-worker-ENHANCED.js
 
 // Import BOTH the old and enhanced WASM functions
-import init, { 
-  get_adf_p_value_and_stationarity, 
+import init, {
+  get_adf_p_value_and_stationarity,
   calculate_complete_adf_test  // NEW enhanced function
 } from "../wasm/adf_test.js"
+// Namespace import so optional kernels can be feature-detected: older
+// builds of the WASM bundle may not export them yet
+import * as wasmKernels from "../wasm/adf_test.js"
 
 let wasmInitialized = false
-
-// Initialize WASM module once
-async function initializeWasm() {
-  if (!wasmInitialized) {
+let wasmInitPromise = null
+
+// Initialize WASM module once. The init promise is memoized so the compile
+// kicked off at worker load is shared by every later caller — a message that
+// arrives mid-compile awaits the same promise instead of starting a second
+// instantiation.
+function initializeWasm() {
+  if (!wasmInitPromise) {
     self.postMessage({ type: "debug", message: "🔧 Initializing Enhanced WASM..." })
-    try {
-      await init()
-      wasmInitialized = true
-      self.postMessage({ type: "debug", message: "✅ Enhanced WASM initialized with calculate_complete_adf_test function." })
-    } catch (e) {
-      console.error("Failed to initialize WASM:", e)
-      self.postMessage({
-        type: "error",
-        message: `WASM initialization error: ${e instanceof Error ? e.message : String(e)}`,
+    wasmInitPromise = init()
+      .then(() => {
+        wasmInitialized = true
+        self.postMessage({ type: "debug", message: "✅ Enhanced WASM initialized with calculate_complete_adf_test function." })
+      })
+      .catch((e) => {
+        console.error("Failed to initialize WASM:", e)
+        self.postMessage({
+          type: "error",
+          message: `WASM initialization error: ${e instanceof Error ? e.message : String(e)}`,
+        })
+        wasmInitPromise = null
+        throw e
       })
-      throw e
-    }
   }
+  return wasmInitPromise
 }
 
 // Call this immediately to start loading WASM in the background
 initializeWasm()
 
+// Rolling z-score: dispatch to the compiled WASM kernel when the loaded
+// bundle exports it, otherwise fall back to the JavaScript loop below.
+const rollingZScores = (data, lookback) => {
+  if (wasmInitialized && typeof wasmKernels.calculate_rolling_zscores === "function") {
+    return Array.from(wasmKernels.calculate_rolling_zscores(new Float64Array(data), lookback))
+  }
+  return calculateZScore(data, lookback)
+}
+
 const calculateZScore = (data, lookback) => {
   if (data.length < lookback) {
     return Array(data.length).fill(0) // Not enough data for initial z-score
   }
 
-  const zScores = []
+  // Rolling sums keep each step O(1): add the entering value, drop the value
+  // leaving the window, and read mean/variance off the running totals
+  const zScores = new Array(data.length)
+  let sum = 0
+  let sumSq = 0
   for (let i = 0; i < data.length; i++) {
-    const windowStart = Math.max(0, i - lookback + 1)
-    const windowData = data.slice(windowStart, i + 1)
-
-    if (windowData.length === lookback) {
-      const mean = windowData.reduce((sum, val) => sum + val, 0) / windowData.length
-      const variance =
-        windowData.length > 1
-          ? windowData.reduce((sum, val) => sum + Math.pow(val - mean, 2), 0) / (windowData.length - 1) // Sample variance
-          : 0 // Handle case where windowData.length is 1
-      const stdDev = Math.sqrt(variance)
-      zScores.push(stdDev > 0 ? (data[i] - mean) / stdDev : 0)
-    } else {
-      zScores.push(0) // Not enough data in window yet
-    }
-  }
-  return zScores
-}
-
-// Helper function for matrix multiplication
-const multiplyMatrices = (A, B) => {
-  const rowsA = A.length
-  const colsA = A[0].length
-  const rowsB = B.length
-  const colsB = B[0].length
-
-  if (colsA !== rowsB) {
-    throw new Error("Matrix dimensions mismatch for multiplication.")
-  }
-
-  const result = Array(rowsA)
-    .fill(0)
-    .map(() => Array(colsB).fill(0))
-
-  for (let i = 0; i < rowsA; i++) {
-    for (let j = 0; j < colsB; j++) {
-      for (let k = 0; k < colsA; k++) {
-        result[i][j] += A[i][k] * B[k][j]
-      }
-    }
-  }
-  return result
-}
-
-// Helper function for matrix transpose
-const transposeMatrix = (matrix) => {
-  const rows = matrix.length
-  const cols = matrix[0].length
-  const result = Array(cols)
-    .fill(0)
-    .map(() => Array(rows).fill(0))
-  for (let i = 0; i < rows; i++) {
-    for (let j = 0; j < cols; j++) {
-      result[j][i] = matrix[i][j]
-    }
-  }
-  return result
-}
-
-// Gaussian elimination for matrix inversion
-const invertMatrix = (matrix) => {
-  const n = matrix.length
-  if (n === 0 || matrix[0].length !== n) {
-    throw new Error("Matrix must be square and non-empty.")
-  }
-
-  // Create an augmented matrix [A | I]
-  const augmentedMatrix = Array(n)
-    .fill(0)
-    .map((_, i) =>
-      Array(2 * n)
-        .fill(0)
-        .map((_, j) => {
-          if (j < n) return matrix[i][j]
-          return i === j - n ? 1 : 0
-        }),
-    )
-
-  // Forward elimination
-  for (let i = 0; i < n; i++) {
-    // Find pivot
-    let pivotRow = i
-    for (let k = i + 1; k < n; k++) {
-      if (Math.abs(augmentedMatrix[k][i]) > Math.abs(augmentedMatrix[pivotRow][i])) {
-        pivotRow = k
-      }
+    const value = data[i]
+    sum += value
+    sumSq += value * value
+
+    if (i >= lookback) {
+      const old = data[i - lookback]
+      sum -= old
+      sumSq -= old * old
     }
-    ;[augmentedMatrix[i], augmentedMatrix[pivotRow]] = [augmentedMatrix[pivotRow], augmentedMatrix[i]]
 
-    const pivot = augmentedMatrix[i][i]
-    if (Math.abs(pivot) < 1e-12) {
-      // Check for near-zero pivot
-      throw new Error("Matrix is singular or ill-conditioned, cannot invert.")
-    }
-
-    // Normalize row
-    for (let j = i; j < 2 * n; j++) {
-      augmentedMatrix[i][j] /= pivot
-    }
-
-    // Eliminate other rows
-    for (let k = 0; k < n; k++) {
-      if (k !== i) {
-        const factor = augmentedMatrix[k][i]
-        for (let j = i; j < 2 * n; j++) {
-          augmentedMatrix[k][j] -= factor * augmentedMatrix[i][j]
-        }
-      }
-    }
-  }
-
-  // Extract inverse matrix
-  const inverse = Array(n)
-    .fill(0)
-    .map((_, i) =>
-      Array(n)
-        .fill(0)
-        .map((_, j) => augmentedMatrix[i][j + n]),
-    )
-  return inverse
-}
-
-// Updated runMultiLinearRegression
-const runMultiLinearRegression = (y_values, x_matrix) => {
-  const numObservations = y_values.length
-  const numPredictors = x_matrix[0].length // Includes intercept
-
-  // Build X transpose * X
-  const Xt = transposeMatrix(x_matrix)
-  const XtX = multiplyMatrices(Xt, x_matrix)
-
-  // Build X transpose * Y
-  const XtY = Array(numPredictors).fill(0)
-  for (let i = 0; i < numPredictors; i++) {
-    for (let k = 0; k < numObservations; k++) {
-      XtY[i] += Xt[i][k] * y_values[k]
-    }
-  }
-
-  let XtX_inv
-  try {
-    XtX_inv = invertMatrix(XtX)
-  } catch (e) {
-    console.error("Error inverting XtX matrix:", e.message)
-    return {
-      coefficients: Array(numPredictors).fill(0),
-      stdErrors: Array(numPredictors).fill(Number.POSITIVE_INFINITY),
-      SSR: Number.POSITIVE_INFINITY,
-      nobs: numObservations,
-      nparams: numPredictors,
-    }
-  }
-
-  // Calculate coefficients (beta_hat = (XtX)^-1 * XtY)
-  const coefficients = Array(numPredictors).fill(0)
-  for (let i = 0; i < numPredictors; i++) {
-    for (let j = 0; j < numPredictors; j++) {
-      coefficients[i] += XtX_inv[i][j] * XtY[j]
-    }
-  }
-
-  // Calculate residuals
-  const residuals = []
-  for (let i = 0; i < numObservations; i++) {
-    let predictedY = 0
-    for (let j = 0; j < numPredictors; j++) {
-      predictedY += coefficients[j] * x_matrix[i][j]
+    if (i + 1 >= lookback) {
+      const mean = sum / lookback
+      const variance = lookback > 1 ? (sumSq - sum * mean) / (lookback - 1) : 0 // Sample variance
+      zScores[i] = variance > 0 ? (value - mean) / Math.sqrt(variance) : 0
+    } else {
+      zScores[i] = 0 // Not enough data in window yet
     }
-    residuals.push(y_values[i] - predictedY)
-  }
-
-  // Calculate Residual Sum of Squares (RSS)
-  const SSR = residuals.reduce((sum, r) => sum + r * r, 0)
-  // Calculate Mean Squared Error (MSE)
-  const MSE = SSR / (numObservations - numPredictors)
-
-  // Calculate standard errors of coefficients
-  const stdErrors = Array(numPredictors).fill(0)
-  for (let i = 0; i < numPredictors; i++) {
-    stdErrors[i] = Math.sqrt(MSE * XtX_inv[i][i])
-  }
-
-  return {
-    coefficients,
-    stdErrors,
-    SSR,
-    nobs: numObservations,
-    nparams: numPredictors,
   }
+  return zScores
 }
 
 // Matrix operations for 2x2 matrices
@@ -246,10 +100,30 @@ const scalarInverse = (x) => {
   return Math.abs(x) < 1e-10 ? 1.0 : 1.0 / x
 }
 
-// OLS regression for hedge ratio calculation
-const calculateHedgeRatio = (pricesA, pricesB, currentIndex, windowSize) => {
-  const startIdx = Math.max(0, currentIndex - windowSize + 1)
-  const endIdx = currentIndex + 1
+// Rolling OLS hedge ratios: dispatch to the compiled WASM kernel when the
+// loaded bundle exports it, otherwise fall back to the JavaScript pass below.
+// The kernel returns betas and alphas concatenated in one Float64Array.
+const rollingHedgeRatios = (closesA, closesB, windowSize) => {
+  if (wasmInitialized && typeof wasmKernels.calculate_rolling_hedge_ratios === "function") {
+    const packed = wasmKernels.calculate_rolling_hedge_ratios(
+      closesA instanceof Float64Array ? closesA : new Float64Array(closesA),
+      closesB instanceof Float64Array ? closesB : new Float64Array(closesB),
+      windowSize,
+    )
+    const n = packed.length / 2
+    return { hedgeRatios: Array.from(packed.subarray(0, n)), alphas: Array.from(packed.subarray(n)) }
+  }
+  return calculateRollingHedgeRatios(closesA, closesB, windowSize)
+}
+
+// Rolling OLS hedge ratios for every bar in a single O(n) pass: the window
+// sums are updated incrementally (add the incoming point, drop the outgoing
+// one) instead of being re-accumulated from scratch per bar. Takes flat
+// numeric price arrays (see the columnar extraction in the message handler).
+const calculateRollingHedgeRatios = (closesA, closesB, windowSize) => {
+  const length = Math.min(closesA.length, closesB.length)
+  const hedgeRatios = new Array(length)
+  const alphas = new Array(length)
 
   let sumA = 0,
     sumB = 0,
@@ -257,36 +131,50 @@ const calculateHedgeRatio = (pricesA, pricesB, currentIndex, windowSize) => {
     sumB2 = 0
   let count = 0
 
-  for (let i = startIdx; i < endIdx; i++) {
-    const priceA = typeof pricesA[i].close === "string" ? Number.parseFloat(pricesA[i].close) : pricesA[i].close
-    const priceB = typeof pricesB[i].close === "string" ? Number.parseFloat(pricesB[i].close) : pricesB[i].close
+  for (let i = 0; i < length; i++) {
+    const priceA = closesA[i]
+    const priceB = closesB[i]
 
-    if (isNaN(priceA) || isNaN(priceB)) {
-      continue
+    if (!isNaN(priceA) && !isNaN(priceB)) {
+      sumA += priceA
+      sumB += priceB
+      sumAB += priceA * priceB
+      sumB2 += priceB * priceB
+      count++
     }
 
-    sumA += priceA
-    sumB += priceB
-    sumAB += priceA * priceB
-    sumB2 += priceB * priceB
-    count++
-  }
+    if (i >= windowSize) {
+      const oldA = closesA[i - windowSize]
+      const oldB = closesB[i - windowSize]
 
-  if (count === 0 || count * sumB2 - sumB * sumB === 0) {
-    return { beta: 1, alpha: 0 }
-  }
+      if (!isNaN(oldA) && !isNaN(oldB)) {
+        sumA -= oldA
+        sumB -= oldB
+        sumAB -= oldA * oldB
+        sumB2 -= oldB * oldB
+        count--
+      }
+    }
 
-  const numerator = count * sumAB - sumA * sumB
-  const denominator = count * sumB2 - sumB * sumB
-  const beta = numerator / denominator
-  const alpha = sumA / count - beta * (sumB / count)
+    const denominator = count * sumB2 - sumB * sumB
+    if (count === 0 || denominator === 0) {
+      hedgeRatios[i] = 1
+      alphas[i] = 0
+      continue
+    }
 
-  return { beta, alpha }
+    const beta = (count * sumAB - sumA * sumB) / denominator
+    hedgeRatios[i] = beta
+    alphas[i] = sumA / count - beta * (sumB / count)
+  }
+
+  return { hedgeRatios, alphas }
 }
 
-// Kalman filter implementation
-const kalmanFilter = (pricesA, pricesB, processNoise, measurementNoise, initialLookback) => {
-  const n = pricesA.length
+// Kalman filter implementation. Takes flat numeric price arrays (see the
+// columnar extraction in the message handler).
+const kalmanFilter = (closesA, closesB, processNoise, measurementNoise, initialLookback) => {
+  const n = closesA.length
 
   if (n < initialLookback) {
     return { hedgeRatios: Array(n).fill(1), alphas: Array(n).fill(0) }
@@ -297,8 +185,8 @@ const kalmanFilter = (pricesA, pricesB, processNoise, measurementNoise, initialL
     sumAB = 0,
     sumB2 = 0
   for (let i = 0; i < initialLookback; i++) {
-    const priceA = typeof pricesA[i].close === "string" ? Number.parseFloat(pricesA[i].close) : pricesA[i].close
-    const priceB = typeof pricesB[i].close === "string" ? Number.parseFloat(pricesB[i].close) : pricesB[i].close
+    const priceA = closesA[i]
+    const priceB = closesB[i]
     sumA += priceA
     sumB += priceB
     sumAB += priceA * priceB
@@ -314,10 +202,8 @@ const kalmanFilter = (pricesA, pricesB, processNoise, measurementNoise, initialL
 
   let residualSumSquares = 0
   for (let i = 0; i < initialLookback; i++) {
-    const priceA = typeof pricesA[i].close === "string" ? Number.parseFloat(pricesA[i].close) : pricesA[i].close
-    const priceB = typeof pricesB[i].close === "string" ? Number.parseFloat(pricesB[i].close) : pricesB[i].close
-    const predicted = initialAlpha + initialBeta * priceB
-    const residual = priceA - predicted
+    const predicted = initialAlpha + initialBeta * closesB[i]
+    const residual = closesA[i] - predicted
     residualSumSquares += residual * residual
   }
   const adaptiveR = residualSumSquares / (initialLookback - 2)
@@ -332,17 +218,19 @@ const kalmanFilter = (pricesA, pricesB, processNoise, measurementNoise, initialL
     [0, processNoise],
   ]
 
-  const hedgeRatios = []
-  const alphas = []
+  // Output length is known up front, so fill preallocated arrays instead of
+  // growing them push by push
+  const hedgeRatios = new Array(n)
+  const alphas = new Array(n)
 
   for (let i = 0; i < initialLookback; i++) {
-    hedgeRatios.push(initialBeta)
-    alphas.push(initialAlpha)
+    hedgeRatios[i] = initialBeta
+    alphas[i] = initialAlpha
   }
 
   for (let i = initialLookback; i < n; i++) {
-    const priceA = typeof pricesA[i].close === "string" ? Number.parseFloat(pricesA[i].close) : pricesA[i].close
-    const priceB = typeof pricesB[i].close === "string" ? Number.parseFloat(pricesB[i].close) : pricesB[i].close
+    const priceA = closesA[i]
+    const priceB = closesB[i]
 
     const x_pred = [...x]
     const P_pred = matrixAdd2x2(P, Q)
@@ -375,15 +263,15 @@ const kalmanFilter = (pricesA, pricesB, processNoise, measurementNoise, initialL
     )
     P = matrixMultiply2x2(I_minus_KH, P_pred)
 
-    alphas.push(x[0])
-    hedgeRatios.push(x[1])
+    alphas[i] = x[0]
+    hedgeRatios[i] = x[1]
   }
 
   return { hedgeRatios, alphas }
 }
 
-const calculateCorrelation = (pricesA, pricesB) => {
-  const n = pricesA.length
+const calculateCorrelation = (closesA, closesB) => {
+  const n = closesA.length
   let sumA = 0,
     sumB = 0,
     sumAB = 0,
@@ -391,11 +279,11 @@ const calculateCorrelation = (pricesA, pricesB) => {
     sumB2 = 0
 
   for (let i = 0; i < n; i++) {
-    sumA += pricesA[i].close
-    sumB += pricesB[i].close
-    sumAB += pricesA[i].close * pricesB[i].close // Corrected: A * B
-    sumA2 += pricesA[i].close * pricesA[i].close
-    sumB2 += pricesB[i].close * pricesB[i].close
+    sumA += closesA[i]
+    sumB += closesB[i]
+    sumAB += closesA[i] * closesB[i] // Corrected: A * B
+    sumA2 += closesA[i] * closesA[i]
+    sumB2 += closesB[i] * closesB[i]
   }
 
   const numerator = n * sumAB - sumA * sumB
@@ -408,26 +296,23 @@ const calculateHalfLife = (spreads) => {
   const n = spreads.length
   if (n < 20) return { halfLife: 0, isValid: false }
 
-  const y = []
-  const x = []
-
-  for (let i = 1; i < n; i++) {
-    y.push(spreads[i] - spreads[i - 1])
-    x.push(spreads[i - 1])
-  }
-
+  // Closed-form single-feature regression of delta-spread on lagged spread:
+  // accumulate the four sums directly from spreads, no intermediate arrays
+  const m = n - 1
   let sumX = 0,
     sumY = 0,
     sumXY = 0,
     sumX2 = 0
-  for (let i = 0; i < y.length; i++) {
-    sumX += x[i]
-    sumY += y[i]
-    sumXY += x[i] * y[i]
-    sumX2 += x[i] * x[i]
+  for (let i = 1; i < n; i++) {
+    const x = spreads[i - 1]
+    const y = spreads[i] - x
+    sumX += x
+    sumY += y
+    sumXY += x * y
+    sumX2 += x * x
   }
 
-  const beta = (y.length * sumXY - sumX * sumY) / (y.length * sumX2 - sumX * sumX)
+  const beta = (m * sumXY - sumX * sumY) / (m * sumX2 - sumX * sumX)
   const halfLife = -Math.log(2) / beta
 
   return {
@@ -436,52 +321,69 @@ const calculateHalfLife = (spreads) => {
   }
 }
 
-const calculateRollingHalfLife = (data, windowSize) => {
-  const result = []
-  if (data.length < windowSize + 1) {
-    return Array(data.length).fill(null)
+// Rolling half-life: dispatch to the compiled WASM kernel when the loaded
+// bundle exports it (NaN marks bars without a valid half-life), otherwise
+// fall back to the JavaScript loop below.
+const rollingHalfLife = (data, windowSize) => {
+  if (wasmInitialized && typeof wasmKernels.calculate_rolling_half_life === "function") {
+    const packed = wasmKernels.calculate_rolling_half_life(
+      data instanceof Float64Array ? data : new Float64Array(data),
+      windowSize,
+    )
+    return Array.from(packed, (value) => (Number.isNaN(value) ? null : value))
   }
+  return calculateRollingHalfLife(data, windowSize)
+}
 
-  for (let i = 0; i < data.length; i++) {
-    if (i < windowSize - 1) {
-      result.push(null)
-      continue
-    }
-
-    const windowData = data.slice(Math.max(0, i - windowSize + 1), i + 1)
-    const mean = windowData.reduce((sum, val) => sum + val, 0) / windowData.length
-
-    const y = []
-    const x = []
+const calculateRollingHalfLife = (data, windowSize) => {
+  const n = data.length
+  const result = new Array(n).fill(null)
+  if (n < windowSize + 1) {
+    return result
+  }
+
+  // The regression slope is invariant to shifting the lagged values by a
+  // constant, so the per-window mean centering of the old version was a
+  // no-op for beta. Dropping it lets the sums over (lagged value, diff)
+  // pairs roll forward in O(1) per bar, mirroring the WASM kernel, instead
+  // of rebuilding each window from slices.
+  const m = windowSize - 1
+  let sumX = 0
+  let sumY = 0
+  let sumXY = 0
+  let sumX2 = 0
 
-    for (let j = 1; j < windowData.length; j++) {
-      y.push(windowData[j] - windowData[j - 1])
-      x.push(windowData[j - 1] - mean)
+  for (let i = 1; i < n; i++) {
+    const xIn = data[i - 1]
+    const yIn = data[i] - xIn
+    sumX += xIn
+    sumY += yIn
+    sumXY += xIn * yIn
+    sumX2 += xIn * xIn
+
+    if (i > m) {
+      const xOut = data[i - m - 1]
+      const yOut = data[i - m] - xOut
+      sumX -= xOut
+      sumY -= yOut
+      sumXY -= xOut * yOut
+      sumX2 -= xOut * xOut
     }
 
-    let sumX = 0,
-      sumY = 0,
-      sumXY = 0,
-      sumX2 = 0
-    for (let j = 0; j < y.length; j++) {
-      sumX += x[j]
-      sumY += y[j]
-      sumXY += x[j] * y[j]
-      sumX2 += x[j] * x[j]
+    if (i < m) {
+      continue
     }
 
-    if (sumX2 === 0) {
-      result.push(null)
+    const denominator = m * sumX2 - sumX * sumX
+    if (denominator === 0) {
       continue
     }
 
-    const beta = (y.length * sumXY - sumX * sumY) / (y.length * sumX2 - sumX * sumX)
+    const beta = (m * sumXY - sumX * sumY) / denominator
     const halfLife = beta < 0 ? -Math.log(2) / beta : null
 
     if (halfLife !== null && halfLife > 0) {
-      result.push(halfLife)
-    } else {
-      result.push(null)
+      result[i] = halfLife
     }
   }
   return result
@@ -555,14 +457,18 @@ const calculateHurstExponent = (data) => {
       const series = data.slice(i, i + lag)
       const mean = series.reduce((sum, val) => sum + val, 0) / lag
 
-      const cumDevs = []
+      // Track the cumulative-deviation extremes inline rather than building
+      // the cumDevs array and spreading it through Math.min/Math.max
       let sum = 0
+      let minCumDev = Number.POSITIVE_INFINITY
+      let maxCumDev = Number.NEGATIVE_INFINITY
       for (let j = 0; j < series.length; j++) {
         sum += series[j] - mean
-        cumDevs.push(sum)
+        if (sum < minCumDev) minCumDev = sum
+        if (sum > maxCumDev) maxCumDev = sum
       }
 
-      const range = Math.max(...cumDevs) - Math.min(...cumDevs)
+      const range = maxCumDev - minCumDev
       const stdDev = Math.sqrt(series.reduce((sum, val) => sum + Math.pow(val - mean, 2), 0) / lag)
 
       if (stdDev > 0) {
@@ -592,9 +498,37 @@ const calculateHurstExponent = (data) => {
 }
 
 // ===== ENHANCED ADF TEST FUNCTION (WASM-Powered) =====
+
+// Re-running an analysis after a parameter tweak often feeds the exact same
+// series back in (e.g. only the z-score lookback changed); remember the last
+// cleaned series and its result so the full WASM lag search isn't repeated
+// for an identical series. The comparison is an exact element-by-element
+// match — an O(n) scan is nothing next to the lag search it skips, and a
+// sampled fingerprint could hand back the wrong statistic on a collision.
+let lastAdfModelType = null
+let lastAdfSeries = null
+let lastAdfResult = null
+
+const sameSeries = (a, b) => {
+  if (a.length !== b.length) return false
+  for (let i = 0; i < a.length; i++) {
+    if (a[i] !== b[i]) return false
+  }
+  return true
+}
+
 const adfTestWasmEnhanced = async (data, seriesType, modelType) => {
-  // Filter out NaN and Infinity values
-  const cleanData = data.filter((val) => typeof val === "number" && isFinite(val))
+  // Filter out NaN and Infinity values, writing straight into the Float64Array
+  // handed to WASM — one pass, one allocation, no intermediate plain array
+  const cleanBuf = new Float64Array(data.length)
+  let cleanCount = 0
+  for (let i = 0; i < data.length; i++) {
+    const val = data[i]
+    if (typeof val === "number" && isFinite(val)) {
+      cleanBuf[cleanCount++] = val
+    }
+  }
+  const cleanData = cleanBuf.subarray(0, cleanCount)
 
   self.postMessage({
     type: "debug",
@@ -609,23 +543,30 @@ const adfTestWasmEnhanced = async (data, seriesType, modelType) => {
     return { statistic: 0, pValue: 1, criticalValues: { "1%": 0, "5%": 0, "10%": 0 }, isStationary: false }
   }
 
+  if (lastAdfResult && modelType === lastAdfModelType && lastAdfSeries && sameSeries(cleanData, lastAdfSeries)) {
+    self.postMessage({ type: "debug", message: `♻️ Enhanced ADF: Reusing cached result for ${seriesType}.` })
+    return lastAdfResult
+  }
+
   try {
     await initializeWasm() // Ensure WASM is loaded
 
-    self.postMessage({ 
-      type: "debug", 
-      message: `🚀 Enhanced ADF: Using complete WASM calculation (NOT JavaScript) for ${seriesType} with model: ${modelType}` 
+    self.postMessage({
+      type: "debug",
+      message: `🚀 Enhanced ADF: Using complete WASM calculation (NOT JavaScript) for ${seriesType} with model: ${modelType}`
     })
 
     // *** KEY CHANGE: Use the enhanced WASM function that calculates EVERYTHING ***
-    const result = calculate_complete_adf_test(new Float64Array(cleanData), modelType)
+    const result = calculate_complete_adf_test(cleanData, modelType)
 
     self.postMessage({ 
       type: "debug", 
       message: `✅ Enhanced ADF Result: t-stat=${result.test_statistic.toFixed(8)}, lags=${result.optimal_lags}, AIC=${result.aic_value.toFixed(3)}, p-value=${result.p_value.toFixed(6)}` 
     })
 
-    return {
+    lastAdfModelType = modelType
+    lastAdfSeries = cleanData.slice()
+    lastAdfResult = {
       statistic: result.test_statistic,  // This is now calculated with nalgebra precision!
       pValue: result.p_value,
       criticalValues: result.critical_values,
@@ -635,6 +576,7 @@ const adfTestWasmEnhanced = async (data, seriesType, modelType) => {
       aicValue: result.aic_value,
       calculationMethod: "Enhanced WASM with nalgebra"
     }
+    return lastAdfResult
   } catch (error) {
     console.error("Error running Enhanced ADF test with WASM:", error)
     self.postMessage({ type: "error", message: `Enhanced ADF Test WASM error: ${error.message}` })
@@ -677,8 +619,19 @@ self.onmessage = async (event) => {
     try {
       const minLength = Math.min(pricesA.length, pricesB.length)
       const dates = pricesA.map((d) => d.date).slice(0, minLength)
-      const stockAPrices = pricesA.map((d) => d.close).slice(0, minLength)
-      const stockBPrices = pricesB.map((d) => d.close).slice(0, minLength)
+
+      // Columnar extraction: coerce each close to a number exactly once and
+      // keep both series in flat Float64Arrays, so the hot loops below work
+      // on contiguous numbers instead of chasing row objects and re-checking
+      // typeof on every access
+      const stockAPrices = new Float64Array(minLength)
+      const stockBPrices = new Float64Array(minLength)
+      for (let i = 0; i < minLength; i++) {
+        const closeA = pricesA[i].close
+        const closeB = pricesB[i].close
+        stockAPrices[i] = typeof closeA === "string" ? Number.parseFloat(closeA) : closeA
+        stockBPrices[i] = typeof closeB === "string" ? Number.parseFloat(closeB) : closeB
+      }
 
       let spreads = []
       let ratios = []
@@ -691,81 +644,122 @@ self.onmessage = async (event) => {
       let stdDevValue = 0
 
       if (modelType === "ratio") {
-        ratios = stockAPrices.map((priceA, i) => priceA / stockBPrices[i])
-        zScores = calculateZScore(ratios, ratioLookbackWindow)
-        rollingHalfLifes = calculateRollingHalfLife(ratios, ratioLookbackWindow)
+        // Build the ratio series and its sum/sum-of-squares in the same pass
+        // instead of one construction pass plus two reduce scans
+        ratios = new Array(minLength)
+        let ratioSum = 0
+        let ratioSumSq = 0
+        for (let i = 0; i < minLength; i++) {
+          const ratio = stockAPrices[i] / stockBPrices[i]
+          ratios[i] = ratio
+          ratioSum += ratio
+          ratioSumSq += ratio * ratio
+        }
+        zScores = rollingZScores(ratios, ratioLookbackWindow)
+        rollingHalfLifes = rollingHalfLife(ratios, ratioLookbackWindow)
         if (ratios.length > 0) {
-          meanValue = ratios.reduce((sum, val) => sum + val, 0) / ratios.length
+          meanValue = ratioSum / ratios.length
           const stdDevDenominator = ratios.length > 1 ? ratios.length - 1 : ratios.length
-          stdDevValue = Math.sqrt(
-            ratios.reduce((sum, val) => sum + Math.pow(val - meanValue, 2), 0) / stdDevDenominator,
-          )
+          stdDevValue = Math.sqrt(Math.max(ratioSumSq - ratios.length * meanValue * meanValue, 0) / stdDevDenominator)
         }
       } else if (modelType === "ols") {
+        const rolling = rollingHedgeRatios(stockAPrices, stockBPrices, olsLookbackWindow)
+        hedgeRatios = rolling.hedgeRatios
+        alphas = rolling.alphas
+        // Generate the spreads and accumulate the warmed-up statistics in the
+        // same pass instead of re-slicing and re-scanning the series
+        spreads = new Array(minLength)
+        let warmCount = 0
+        let warmSum = 0
+        let warmSumSq = 0
         for (let i = 0; i < minLength; i++) {
-          const { beta, alpha } = calculateHedgeRatio(pricesA, pricesB, i, olsLookbackWindow)
-          const currentPriceA =
-            typeof pricesA[i].close === "string" ? Number.parseFloat(pricesA[i].close) : pricesA[i].close
-          const currentPriceB =
-            typeof pricesB[i].close === "string" ? Number.parseFloat(pricesB[i].close) : pricesB[i].close
-          const spread = currentPriceA - (alpha + beta * currentPriceB)
-          hedgeRatios.push(beta)
-          alphas.push(alpha)
-          spreads.push(spread)
+          const spread = stockAPrices[i] - (alphas[i] + hedgeRatios[i] * stockBPrices[i])
+          spreads[i] = spread
+          if (i >= olsLookbackWindow - 1) {
+            warmCount++
+            warmSum += spread
+            warmSumSq += spread * spread
+          }
         }
-        zScores = calculateZScore(spreads, zScoreLookback)
-        rollingHalfLifes = calculateRollingHalfLife(spreads, olsLookbackWindow)
-        const warmedUpSpreads = spreads.slice(olsLookbackWindow - 1)
-        if (warmedUpSpreads.length > 0) {
-          meanValue = warmedUpSpreads.reduce((sum, val) => sum + val, 0) / warmedUpSpreads.length
-          const stdDevDenominator = warmedUpSpreads.length > 1 ? warmedUpSpreads.length - 1 : warmedUpSpreads.length
-          stdDevValue = Math.sqrt(
-            warmedUpSpreads.reduce((sum, val) => sum + Math.pow(val - meanValue, 2), 0) / stdDevDenominator,
-          )
+        zScores = rollingZScores(spreads, zScoreLookback)
+        rollingHalfLifes = rollingHalfLife(spreads, olsLookbackWindow)
+        if (warmCount > 0) {
+          meanValue = warmSum / warmCount
+          const stdDevDenominator = warmCount > 1 ? warmCount - 1 : warmCount
+          stdDevValue = Math.sqrt(Math.max(warmSumSq - warmCount * meanValue * meanValue, 0) / stdDevDenominator)
         }
       } else if (modelType === "kalman") {
         const kalmanResults = kalmanFilter(
-          pricesA,
-          pricesB,
+          stockAPrices,
+          stockBPrices,
           kalmanProcessNoise,
           kalmanMeasurementNoise,
           kalmanInitialLookback,
         )
         hedgeRatios = kalmanResults.hedgeRatios
         alphas = kalmanResults.alphas
-        spreads = stockAPrices.map((priceA, i) => priceA - (alphas[i] + hedgeRatios[i] * stockBPrices[i]))
-        zScores = calculateZScore(spreads, zScoreLookback)
-        rollingHalfLifes = calculateRollingHalfLife(spreads, kalmanInitialLookback)
-        const warmedUpSpreads = spreads.slice(kalmanInitialLookback - 1)
-        if (warmedUpSpreads.length > 0) {
-          meanValue = warmedUpSpreads.reduce((sum, val) => sum + val, 0) / warmedUpSpreads.length
-          const stdDevDenominator = warmedUpSpreads.length > 1 ? warmedUpSpreads.length - 1 : warmedUpSpreads.length
-          stdDevValue = Math.sqrt(
-            warmedUpSpreads.reduce((sum, val) => sum + Math.pow(val - meanValue, 2), 0) / stdDevDenominator,
-          )
+        // Same fused spread + warmed-up statistics pass as the OLS branch
+        spreads = new Array(minLength)
+        let warmCount = 0
+        let warmSum = 0
+        let warmSumSq = 0
+        for (let i = 0; i < minLength; i++) {
+          const spread = stockAPrices[i] - (alphas[i] + hedgeRatios[i] * stockBPrices[i])
+          spreads[i] = spread
+          if (i >= kalmanInitialLookback - 1) {
+            warmCount++
+            warmSum += spread
+            warmSumSq += spread * spread
+          }
+        }
+        zScores = rollingZScores(spreads, zScoreLookback)
+        rollingHalfLifes = rollingHalfLife(spreads, kalmanInitialLookback)
+        if (warmCount > 0) {
+          meanValue = warmSum / warmCount
+          const stdDevDenominator = warmCount > 1 ? warmCount - 1 : warmCount
+          stdDevValue = Math.sqrt(Math.max(warmSumSq - warmCount * meanValue * meanValue, 0) / stdDevDenominator)
         }
       } else if (modelType === "euclidean") {
-        const initialPriceA = pricesA[0].close
-        const initialPriceB = pricesB[0].close
-        const normalizedPricesA = stockAPrices.map((p) => p / initialPriceA)
-        const normalizedPricesB = stockBPrices.map((p) => p / initialPriceB)
-        distances = normalizedPricesA.map((normA, i) => Math.abs(normA - normalizedPricesB[i]))
-        zScores = calculateZScore(distances, euclideanLookbackWindow)
-        rollingHalfLifes = calculateRollingHalfLife(distances, euclideanLookbackWindow)
+        const initialPriceA = stockAPrices[0]
+        const initialPriceB = stockBPrices[0]
+        // Same fused construction + statistics pass as the ratio branch
+        distances = new Array(minLength)
+        let distanceSum = 0
+        let distanceSumSq = 0
+        for (let i = 0; i < minLength; i++) {
+          const distance = Math.abs(stockAPrices[i] / initialPriceA - stockBPrices[i] / initialPriceB)
+          distances[i] = distance
+          distanceSum += distance
+          distanceSumSq += distance * distance
+        }
+        zScores = rollingZScores(distances, euclideanLookbackWindow)
+        rollingHalfLifes = rollingHalfLife(distances, euclideanLookbackWindow)
         if (distances.length > 0) {
-          meanValue = distances.reduce((sum, val) => sum + val, 0) / distances.length
+          meanValue = distanceSum / distances.length
           const stdDevDenominator = distances.length > 1 ? distances.length - 1 : distances.length
           stdDevValue = Math.sqrt(
-            distances.reduce((sum, val) => sum + Math.pow(val - meanValue, 2), 0) / stdDevDenominator,
+            Math.max(distanceSumSq - distances.length * meanValue * meanValue, 0) / stdDevDenominator,
           )
         }
       }
 
-      const validZScores = zScores.filter((z) => !isNaN(z))
-      const minZScore = validZScores.length > 0 ? Math.min(...validZScores) : 0
-      const maxZScore = validZScores.length > 0 ? Math.max(...validZScores) : 0
+      // Single pass over the z-scores: spreading a filtered copy through
+      // Math.min/Math.max reads the series three times and can overflow the
+      // argument limit on long histories
+      let minZScore = Number.POSITIVE_INFINITY
+      let maxZScore = Number.NEGATIVE_INFINITY
+      for (let i = 0; i < zScores.length; i++) {
+        const z = zScores[i]
+        if (isNaN(z)) continue
+        if (z < minZScore) minZScore = z
+        if (z > maxZScore) maxZScore = z
+      }
+      if (minZScore > maxZScore) {
+        minZScore = 0
+        maxZScore = 0
+      }
 
-      const correlation = calculateCorrelation(pricesA.slice(0, minLength), pricesB.slice(0, minLength))
+      const correlation = calculateCorrelation(stockAPrices, stockBPrices)
       
       // *** KEY CHANGE: Use Enhanced WASM ADF Test ***
       const seriesForADF = modelType === "ratio" ? ratios : modelType === "euclidean" ? distances : spreads
@@ -796,20 +790,24 @@ self.onmessage = async (event) => {
           row.hedgeRatio = hedgeRatios[i]
           row.spread = spreads[i]
         } else if (modelType === "euclidean") {
-          row.normalizedA = stockAPrices[i] / pricesA[0].close
-          row.normalizedB = stockBPrices[i] / pricesB[0].close
+          row.normalizedA = stockAPrices[i] / stockAPrices[0]
+          row.normalizedB = stockBPrices[i] / stockBPrices[0]
           row.distance = distances[i]
         }
         tableData.push(row)
       }
 
-      const rollingMean = []
-      const rollingUpperBand1 = []
-      const rollingLowerBand1 = []
-      const rollingUpperBand2 = []
-      const rollingLowerBand2 = []
-
       const dataForBands = modelType === "ratio" ? ratios : modelType === "euclidean" ? distances : spreads
+
+      // Chart bands are display-only, so float32 is plenty of precision and
+      // halves the size of the structured clone back to the page. Regression
+      // and test statistics above stay in float64.
+      const rollingMean = new Float32Array(dataForBands.length)
+      const rollingUpperBand1 = new Float32Array(dataForBands.length)
+      const rollingLowerBand1 = new Float32Array(dataForBands.length)
+      const rollingUpperBand2 = new Float32Array(dataForBands.length)
+      const rollingLowerBand2 = new Float32Array(dataForBands.length)
+
       const rollingStatsWindow =
         modelType === "ratio"
           ? ratioLookbackWindow
@@ -817,17 +815,29 @@ self.onmessage = async (event) => {
             ? euclideanLookbackWindow
             : olsLookbackWindow
 
+      // Roll the window sum and sum of squares forward in O(1) per bar
+      // instead of re-slicing and re-reducing every window
+      let bandSum = 0
+      let bandSumSq = 0
       for (let i = 0; i < dataForBands.length; i++) {
-        const windowStart = Math.max(0, i - rollingStatsWindow + 1)
-        const window = dataForBands.slice(windowStart, i + 1)
-        const mean = window.reduce((sum, val) => sum + val, 0) / window.length
-        const stdDev = Math.sqrt(window.reduce((sum, val) => sum + Math.pow(val - mean, 2), 0) / window.length)
-
-        rollingMean.push(mean)
-        rollingUpperBand1.push(mean + stdDev)
-        rollingLowerBand1.push(mean - stdDev)
-        rollingUpperBand2.push(mean + 2 * stdDev)
-        rollingLowerBand2.push(mean - 2 * stdDev)
+        const incoming = dataForBands[i]
+        bandSum += incoming
+        bandSumSq += incoming * incoming
+        if (i >= rollingStatsWindow) {
+          const outgoing = dataForBands[i - rollingStatsWindow]
+          bandSum -= outgoing
+          bandSumSq -= outgoing * outgoing
+        }
+
+        const windowLength = Math.min(i + 1, rollingStatsWindow)
+        const mean = bandSum / windowLength
+        const stdDev = Math.sqrt(Math.max(bandSumSq / windowLength - mean * mean, 0))
+
+        rollingMean[i] = mean
+        rollingUpperBand1[i] = mean + stdDev
+        rollingLowerBand1[i] = mean - stdDev
+        rollingUpperBand2[i] = mean + 2 * stdDev
+        rollingLowerBand2[i] = mean - 2 * stdDev
       }
 
       analysisData = {
@@ -0,0 +1,187 @@
+// public/workers/scanner-worker.js
+//
+// Batch pair screening off the main thread: the scanner page prepares flat
+// numeric close arrays for every pair and posts them here in one message, so
+// the UI stays responsive while all pair metrics are computed back-to-back.
+
+// Calculate correlation between two arrays
+const calculateCorrelation = (x, y) => {
+  const n = x.length
+  let sumX = 0
+  let sumY = 0
+  let sumXY = 0
+  let sumX2 = 0
+  let sumY2 = 0
+
+  for (let i = 0; i < n; i++) {
+    sumX += x[i]
+    sumY += y[i]
+    sumXY += x[i] * y[i]
+    sumX2 += x[i] * x[i]
+    sumY2 += y[i] * y[i]
+  }
+
+  const numerator = n * sumXY - sumX * sumY
+  const denominator = Math.sqrt((n * sumX2 - sumX * sumX) * (n * sumY2 - sumY * sumY))
+
+  return denominator === 0 ? 0 : numerator / denominator
+}
+
+// Calculate OLS regression
+const calculateOLS = (y, x) => {
+  const n = x.length
+  let sumX = 0
+  let sumY = 0
+  let sumXY = 0
+  let sumX2 = 0
+
+  for (let i = 0; i < n; i++) {
+    sumX += x[i]
+    sumY += y[i]
+    sumXY += x[i] * y[i]
+    sumX2 += x[i] * x[i]
+  }
+
+  const slope = (n * sumXY - sumX * sumY) / (n * sumX2 - sumX * sumX)
+  const intercept = (sumY - slope * sumX) / n
+
+  return { slope, intercept }
+}
+
+// Calculate Kalman filter (simplified implementation)
+const calculateKalmanFilter = (y, x) => {
+  // For simplicity, we'll use OLS as an approximation
+  // In a real implementation, this would be a proper Kalman filter
+  return calculateOLS(y, x)
+}
+
+// Calculate half-life of mean reversion
+const calculateHalfLife = (spread) => {
+  // Linear regression: deltaSpread = beta * laggedSpread + error, with the
+  // sums accumulated straight from the spread series
+  const m = spread.length - 1
+  let sumX = 0
+  let sumY = 0
+  let sumXY = 0
+  let sumX2 = 0
+
+  for (let i = 1; i < spread.length; i++) {
+    const x = spread[i - 1]
+    const y = spread[i] - x
+    sumX += x
+    sumY += y
+    sumXY += x * y
+    sumX2 += x * x
+  }
+
+  const beta = (m * sumXY - sumX * sumY) / (m * sumX2 - sumX * sumX)
+
+  // Calculate half-life: -log(2) / log(1 + beta)
+  if (beta >= 0) {
+    return null // No mean reversion
+  }
+
+  return Math.round(-Math.log(2) / Math.log(1 + beta))
+}
+
+// Calculate pair metrics based on selected method; mirrors the single-pass
+// spread construction on the scanner page
+const calculatePairMetrics = (pricesA, pricesB, method, stockASymbol, stockBSymbol) => {
+  const correlation = calculateCorrelation(pricesA, pricesB)
+
+  const spread = new Array(pricesA.length)
+  let halfLife = null
+
+  let slope = 0
+  let intercept = 0
+  if (method === "ols") {
+    ;({ slope, intercept } = calculateOLS(pricesA, pricesB))
+  } else if (method === "kalman") {
+    ;({ slope, intercept } = calculateKalmanFilter(pricesA, pricesB))
+  }
+
+  let spreadSum = 0
+  let spreadSumSq = 0
+  for (let i = 0; i < pricesA.length; i++) {
+    const value = method === "ratio" ? pricesA[i] / pricesB[i] : pricesA[i] - (slope * pricesB[i] + intercept)
+    spread[i] = value
+    spreadSum += value
+    spreadSumSq += value * value
+  }
+
+  const mean = spreadSum / spread.length
+  const stdDev = Math.sqrt(Math.max(spreadSumSq / spread.length - mean * mean, 0))
+
+  const zScore = (spread[spread.length - 1] - mean) / stdDev
+
+  try {
+    halfLife = calculateHalfLife(spread)
+  } catch (err) {
+    halfLife = null
+  }
+
+  let signal = "None"
+  if (zScore > 0) {
+    signal = `Short ${stockASymbol} / Long ${stockBSymbol}`
+  } else if (zScore < 0) {
+    signal = `Long ${stockASymbol} / Short ${stockBSymbol}`
+  }
+
+  return { zScore, correlation, halfLife, signal }
+}
+
+self.onmessage = (event) => {
+  const { type, pairs, method, minZScore, maxZScore } = event.data
+
+  if (type !== "scanPairs") {
+    return
+  }
+
+  const results = []
+
+  for (let i = 0; i < pairs.length; i++) {
+    const pair = pairs[i]
+
+    try {
+      const { zScore, correlation, halfLife, signal } = calculatePairMetrics(
+        pair.pricesA,
+        pair.pricesB,
+        method,
+        pair.stockA,
+        pair.stockB,
+      )
+
+      // Check if z-score is within the specified range (absolute value)
+      const absZScore = Math.abs(zScore)
+      if (absZScore >= minZScore && absZScore <= maxZScore) {
+        results.push({
+          stockA: pair.stockA,
+          stockB: pair.stockB,
+          watchlistName: pair.watchlistName,
+          watchlistId: pair.watchlistId,
+          zScore,
+          correlation,
+          halfLife,
+          signal,
+          method,
+          lastPriceA: pair.lastPriceA,
+          lastPriceB: pair.lastPriceB,
+          lastDate: pair.lastDate,
+        })
+      }
+    } catch (err) {
+      console.error(`Error processing pair ${pair.stockA}/${pair.stockB}:`, err)
+    }
+
+    // Progress updates are cheap here and let the page paint a live bar
+    // without yielding its own event loop
+    if (i % 10 === 9 || i === pairs.length - 1) {
+      self.postMessage({ type: "progress", processed: i + 1, total: pairs.length })
+    }
+  }
+
+  // Sort results by absolute z-score (descending)
+  results.sort((a, b) => Math.abs(b.zScore) - Math.abs(a.zScore))
+
+  self.postMessage({ type: "scanComplete", results })
+}